@@ -1,13 +1,131 @@
 import os
+import random
+import re
+import select
+import selectors
 import shutil
+import signal
 import subprocess
+import threading
 import time
-from typing import List
+import types
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
 
 import psutil
 
 from .exceptions import ConfigurationError, NordVpnCliError
 
+# One "key: value" line of `nordvpn status`. Lines may also start after a bare
+# carriage return, which the CLI uses to draw its progress spinner.
+_STATUS_LINE_RE = re.compile(
+    rb"(?:^|(?<=\r))[ \t]*([^:\r\n]+?)[ \t]*:[ \t]*([^\r\n]*?)[ \t]*(?=[\r\n]|\Z)",
+    re.MULTILINE,
+)
+
+
+_MAX_CAPTURE_BYTES = 1024 * 1024  # Per-stream cap on captured CLI output.
+
+
+# Executables already found on PATH. Misses are not stored, so a tool
+# installed while the process runs is picked up on the next lookup.
+_WHICH_HITS: Dict[str, str] = {}
+
+
+def _which_cached(name: str) -> str | None:
+    """
+    Memoized `shutil.which`, so each found binary walks PATH only once per process.
+
+    Args:
+        name: Command name or path to resolve.
+
+    Returns:
+        The resolved executable path, or None if it was not found.
+    """
+    resolved = _WHICH_HITS.get(name)
+    if resolved is None:
+        resolved = shutil.which(name)
+        if resolved is not None:
+            _WHICH_HITS[name] = resolved
+    return resolved
+
+
+def _run_bounded(command: Sequence[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Runs a command and captures its output, keeping at most `_MAX_CAPTURE_BYTES` per stream.
+
+    Both pipes are drained as data arrives, so a chatty process can neither
+    block on a full pipe nor grow the captured output without bound.
+
+    Args:
+        command: Command and arguments to execute.
+        timeout: Maximum run time in seconds.
+
+    Returns:
+        subprocess.CompletedProcess with bytes stdout/stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time. The
+            process is killed before raising, as it is on any other exception.
+    """
+    # The default close_fds=True is kept on purpose: since Python 3.10 that path
+    # already spawns via vfork, so the cost does not scale with the parent's
+    # memory, and the host application's inheritable descriptors stay out of
+    # the child.
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+    )
+    buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    deadline = time.monotonic() + timeout
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            for pipe in buffers:
+                selector.register(pipe, selectors.EVENT_READ)
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    buffer = buffers[key.fileobj]
+                    room = _MAX_CAPTURE_BYTES - len(buffer)
+                    if room > 0:
+                        buffer += chunk[:room]
+
+        returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        try:
+            # Bounded: a child stuck in uninterruptible sleep must not hang the
+            # caller. Popen reaps it later if it outlives this wait.
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        raise subprocess.TimeoutExpired(command, timeout) from None
+    except BaseException:
+        # Same as subprocess.run: never leave the child running, e.g. when a
+        # KeyboardInterrupt arrives during a long `nordvpn connect`.
+        proc.kill()
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        raise
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+
+    return subprocess.CompletedProcess(
+        command, returncode, bytes(buffers[proc.stdout]), bytes(buffers[proc.stderr])
+    )
+
 
 def find_nordvpn_executable() -> str:
     """
@@ -19,7 +137,7 @@ def find_nordvpn_executable() -> str:
     Raises:
         ConfigurationError: If the executable cannot be found in PATH.
     """
-    resolved = shutil.which("nordvpn")
+    resolved = _which_cached("nordvpn")
     if resolved:
         return resolved
 
@@ -28,11 +146,45 @@ def find_nordvpn_executable() -> str:
     )
 
 
+def _find_processes_by_name(names: set) -> Iterator[Tuple[int, str]]:
+    """
+    Finds processes by their short command name by reading `/proc/<pid>/comm`.
+
+    This reads one small file per PID instead of building a full process
+    object for every entry on the system.
+
+    Args:
+        names: Lower-cased process names to match.
+
+    Yields:
+        Tuples of (pid, name) for each matching process.
+    """
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm", encoding="utf-8", errors="replace") as f:
+                    name = f.read().strip()
+            except OSError:
+                # The process exited while scanning or is not readable.
+                continue
+            if name.lower() in names:
+                yield int(entry.name), name
+
+
 class LinuxVpnController:
     """
     Controls NordVPN on Linux using the `nordvpn` CLI.
     """
 
+    STATUS_TTL = 1.0  # Seconds a parsed `nordvpn status` result may be reused.
+
     def __init__(self, exe_path: str):
         """
         Initializes the controller.
@@ -41,43 +193,95 @@ class LinuxVpnController:
             exe_path: Optional CLI executable path/name. If empty, defaults to `nordvpn`.
         """
         candidate = exe_path or "nordvpn"
-        resolved = shutil.which(candidate)
+        # An absolute path needs only one access check; only bare names walk PATH.
+        if os.path.isabs(candidate):
+            resolved = candidate if os.access(candidate, os.X_OK) else None
+        else:
+            resolved = _which_cached(candidate)
 
         if resolved:
             self.exe_path = resolved
-        elif os.path.isabs(candidate) and os.path.exists(candidate):
-            self.exe_path = candidate
         else:
             raise ConfigurationError(
                 "Could not find NordVPN CLI executable. Ensure 'nordvpn' is installed and in PATH, "
                 "or provide a valid custom_exe_path."
             )
 
+        self._status_command: Tuple[str, ...] = (self.exe_path, "status")
+        self._status_cache: tuple[float, dict] | None = None
+        self._status_not_before: float = 0.0  # Results from CLI calls started earlier are stale.
+        self._status_lock = threading.Lock()
+        self._status_max_age: float = self.STATUS_TTL
+        self._status_poll_stop: threading.Event | None = None
+
     def _run_command(self, args: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
         """
         Executes a NordVPN CLI command.
 
+        The `nordvpn` CLI has no interactive or batch mode to keep open, so each
+        call is a separate process; status reads are cached for `STATUS_TTL`
+        seconds to keep the number of spawns down.
+
         Args:
             args: List of command arguments.
             timeout: Command timeout in seconds.
 
         Returns:
-            subprocess.CompletedProcess containing command output.
+            subprocess.CompletedProcess containing decoded text output.
 
         Raises:
             ConfigurationError: If the executable is not available.
             NordVpnCliError: If the command fails or times out.
         """
-        command = [self.exe_path, *args]
+        result = self._run_command_bytes(args, timeout=timeout)
+        return subprocess.CompletedProcess(
+            result.args,
+            result.returncode,
+            result.stdout.decode("utf-8", errors="replace"),
+            result.stderr.decode("utf-8", errors="replace"),
+        )
+
+    def _run_command_bytes(self, args: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+        """
+        Executes a NordVPN CLI command and returns its output as raw bytes.
+
+        The status path uses this directly, since it reads only a few short
+        values and a full UTF-8 decode of stdout would be wasted work. Output is
+        decoded here only when building an error message.
+
+        Args:
+            args: List of command arguments.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            subprocess.CompletedProcess with bytes stdout/stderr.
+
+        Raises:
+            ConfigurationError: If the executable is not available.
+            NordVpnCliError: If the command fails or times out.
+        """
+        return self._run_prepared_command((self.exe_path, *args), timeout=timeout)
+
+    def _run_prepared_command(self, command: Tuple[str, ...], timeout: int = 60) -> subprocess.CompletedProcess:
+        """
+        Executes a fully built NordVPN CLI command and returns its output as raw bytes.
+
+        Hot call sites pass a command tuple built once (e.g. `_status_command`)
+        instead of assembling a new argument list per call.
+
+        Args:
+            command: Executable path followed by its arguments.
+            timeout: Command timeout in seconds.
+
+        Returns:
+            subprocess.CompletedProcess with bytes stdout/stderr.
 
+        Raises:
+            ConfigurationError: If the executable is not available.
+            NordVpnCliError: If the command fails or times out.
+        """
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-            )
+            result = _run_bounded(command, timeout)
         except FileNotFoundError as e:
             raise ConfigurationError(
                 "NordVPN CLI not found. Ensure 'nordvpn' is installed and available in PATH."
@@ -92,41 +296,166 @@ class LinuxVpnController:
             ) from e
 
         if result.returncode != 0:
-            error_message = (result.stderr or result.stdout or "Unknown CLI error").strip()
+            error_output = (result.stderr or result.stdout or b"Unknown CLI error").strip()
+            error_message = error_output.decode("utf-8", errors="replace")
             raise NordVpnCliError(
                 f"NordVPN CLI command '{' '.join(command)}' failed.\nError: {error_message}"
             )
 
         return result
 
-    def _get_status_output(self) -> str:
+    def _get_status_output(self) -> bytes:
         """
         Returns the raw output of `nordvpn status`.
 
         Raises:
             NordVpnCliError: If the status command fails.
         """
-        return self._run_command(["status"], timeout=20).stdout
+        return self._run_prepared_command(self._status_command, timeout=20).stdout
 
     @staticmethod
-    def _parse_status_output(output: str) -> dict:
+    def _parse_status_output(output: bytes) -> dict:
         """
         Parses key-value style output from `nordvpn status`.
 
+        All fields are extracted in a single pass of a precompiled regex, and
+        only the matched keys and values are decoded.
+
         Args:
             output: Raw CLI output.
 
         Returns:
             A dictionary of lower-cased keys to string values.
         """
-        parsed = {}
-        for line in output.splitlines():
-            if ":" not in line:
-                continue
-            key, value = line.split(":", 1)
-            parsed[key.strip().lower()] = value.strip()
+        return {
+            key.lower().decode("ascii", errors="replace"): value.decode("utf-8", errors="replace")
+            for key, value in _STATUS_LINE_RE.findall(output)
+        }
+
+    def _cached_parsed_status(self, refresh: bool = False) -> dict:
+        """
+        Returns the parsed `nordvpn status` output, reusing it while it is fresh enough.
+
+        Results are reused for `STATUS_TTL` seconds, or for twice the polling
+        interval while background polling is active.
+
+        Args:
+            refresh: If True, always queries the CLI and updates the cache.
+
+        Returns:
+            A dictionary of lower-cased keys to string values.
+
+        Raises:
+            NordVpnCliError: If the status command fails.
+        """
+        with self._status_lock:
+            cached = self._status_cache
+        if not refresh and cached and time.monotonic() - cached[0] < self._status_max_age:
+            return cached[1]
+
+        started = time.monotonic()
+        parsed = self._parse_status_output(self._get_status_output())
+        self._store_status(started, parsed)
         return parsed
 
+    def _store_status(self, started: float, parsed: dict, stop_event: threading.Event | None = None):
+        """
+        Stores a parsed status result unless a newer one is already cached.
+
+        Results are stamped with the time their CLI call started, so a slow
+        call (e.g. from the background poller) cannot overwrite a result that
+        was read later, nor one read after `_invalidate_status_cache`.
+
+        Args:
+            started: Monotonic time at which the status command was launched.
+            parsed: Parsed status output.
+            stop_event: Poller stop event; if set, the result is discarded.
+        """
+        with self._status_lock:
+            if stop_event is not None and stop_event.is_set():
+                return
+            if started < self._status_not_before:
+                return
+            if self._status_cache is not None and self._status_cache[0] > started:
+                return
+            self._status_cache = (started, parsed)
+
+    def _invalidate_status_cache(self):
+        """Drops the cached status and rejects results of CLI calls already in flight."""
+        with self._status_lock:
+            self._status_cache = None
+            self._status_not_before = time.monotonic()
+
+    def _start_status_polling(self, interval: float = 2.0):
+        """
+        Starts refreshing the status cache in a background thread.
+
+        While polling is active, `get_status`, `get_current_ip`,
+        `get_connected_server` and `get_status_full` return the latest background
+        result immediately instead of invoking the CLI. This is useful for
+        callers that read status more often than once per second. Calling this
+        again restarts polling with the new interval. Private because the
+        Windows controller has no equivalent, so `VpnSwitcher` cannot expose it.
+
+        Args:
+            interval: Seconds between background status refreshes.
+        """
+        self._stop_status_polling()
+        stop_event = threading.Event()
+        self._status_poll_stop = stop_event
+        self._status_max_age = max(self.STATUS_TTL, interval * 2)
+        threading.Thread(
+            target=self._refresh_status_loop,
+            args=(stop_event, interval),
+            name="nordvpn-status-poller",
+            daemon=True,
+        ).start()
+
+    def _stop_status_polling(self):
+        """
+        Stops background status polling started by `_start_status_polling`.
+
+        The background thread exits after its current refresh, if any; the
+        result of that refresh is discarded.
+        """
+        if self._status_poll_stop is None:
+            return
+        with self._status_lock:
+            # Set under the lock, so no in-flight refresh stores after this returns.
+            self._status_poll_stop.set()
+        self._status_poll_stop = None
+        self._status_max_age = self.STATUS_TTL
+
+    def _refresh_status_loop(self, stop_event: threading.Event, interval: float):
+        """
+        Background loop that refreshes the status cache until `stop_event` is set.
+
+        Args:
+            stop_event: Event signalling the loop to exit.
+            interval: Seconds between refreshes.
+        """
+        while not stop_event.is_set():
+            try:
+                started = time.monotonic()
+                parsed = self._parse_status_output(self._get_status_output())
+                self._store_status(started, parsed, stop_event)
+            except (NordVpnCliError, ConfigurationError):
+                # Readers fall back to a synchronous call once the cache goes stale.
+                pass
+            stop_event.wait(interval)
+
+    def _snapshot(self) -> Mapping[str, str]:
+        """
+        Gets all fields of the current CLI status from a single `nordvpn status` call.
+
+        The public getters read from this shared view; callers that need
+        several fields use `get_status_full`, which both controllers provide.
+
+        Returns:
+            A read-only mapping of lower-cased status keys to string values.
+        """
+        return types.MappingProxyType(self._cached_parsed_status())
+
     def get_status(self) -> str:
         """
         Gets the current VPN status as reported by the NordVPN CLI.
@@ -134,8 +463,7 @@ class LinuxVpnController:
         Returns:
             A human-readable status string (e.g., 'Connected', 'Disconnected').
         """
-        parsed = self._parse_status_output(self._get_status_output())
-        return parsed.get("status", "Unknown")
+        return self._snapshot().get("status", "Unknown")
 
     def get_status_full(self) -> dict:
         """
@@ -144,7 +472,7 @@ class LinuxVpnController:
         Returns:
             A dictionary containing all key-value pairs from the CLI status output.
         """
-        return self._parse_status_output(self._get_status_output())
+        return dict(self._snapshot())
 
     def get_current_ip(self) -> str | None:
         """
@@ -153,12 +481,7 @@ class LinuxVpnController:
         Returns:
             The IP string if available, otherwise None.
         """
-        parsed = self._parse_status_output(self._get_status_output())
-        for key in ("your new ip", "current ip", "ip"):
-            value = parsed.get(key)
-            if value and value.lower() not in {"n/a", "none", "-"}:
-                return value
-        return None
+        return self._first_status_value(self._snapshot(), ("your new ip", "current ip", "ip"))
 
     def get_connected_server(self) -> str | None:
         """
@@ -167,47 +490,70 @@ class LinuxVpnController:
         Returns:
             The server name/host if connected, otherwise None.
         """
-        parsed = self._parse_status_output(self._get_status_output())
-        for key in ("current server", "server"):
-            value = parsed.get(key)
+        return self._first_status_value(self._snapshot(), ("current server", "server"))
+
+    @staticmethod
+    def _first_status_value(status: Mapping[str, str], keys: Tuple[str, ...]) -> str | None:
+        """
+        Returns the first meaningful value among `keys` in a parsed status mapping.
+
+        Placeholder values such as 'n/a', 'none' and '-' are skipped.
+        """
+        for key in keys:
+            value = status.get(key)
             if value and value.lower() not in {"n/a", "none", "-"}:
                 return value
         return None
 
-    def _is_connected(self) -> bool:
+    def _is_connected(self, refresh: bool = False) -> bool:
         """
         Checks current VPN connection status.
 
+        Args:
+            refresh: If True, bypasses the status cache.
+
         Returns:
             True if connected, False otherwise.
 
         Raises:
             NordVpnCliError: If `nordvpn status` fails.
         """
-        status = self.get_status().strip().lower()
-        return status == "connected" or ("connected" in status and "disconnected" not in status)
+        status = self._cached_parsed_status(refresh=refresh).get("status", "")
+        return status.lower() == "connected"
 
     def _wait_for_status(self, connected: bool, timeout: int = 45, interval: float = 1.0):
         """
         Waits until VPN reaches desired connection status.
 
+        Polls with exponential backoff (starting at 50 ms, capped at `interval`)
+        so fast transitions are seen almost immediately while slow ones do not
+        hammer the CLI. The CLI offers no way to be notified of a state change,
+        and a `nordvpnd` exit only makes the next status call fail, so there is
+        nothing better to block on than this sleep.
+
         Args:
             connected: Desired connection state.
             timeout: Maximum wait time in seconds.
-            interval: Poll interval in seconds.
+            interval: Maximum poll interval in seconds.
 
         Raises:
             NordVpnCliError: If desired state is not reached in time.
         """
-        end_time = time.time() + timeout
-        while time.time() < end_time:
+        end_time = time.monotonic() + timeout
+        delay = min(0.05, interval)
+        while True:
             try:
-                if self._is_connected() == connected:
+                if self._is_connected(refresh=True) == connected:
                     return
             except NordVpnCliError:
                 # Keep polling to tolerate transient daemon/route states.
                 pass
-            time.sleep(interval)
+
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.7 + random.uniform(0, 0.02), interval)
 
         state = "connected" if connected else "disconnected"
         raise NordVpnCliError(f"NordVPN did not become {state} within {timeout} seconds.")
@@ -221,14 +567,16 @@ class LinuxVpnController:
             is_group: Whether the target represents a group.
         """
         label = "group" if is_group else "server"
-        print(f"\x1b[34mConnecting to {label} '{target}'...\x1b[0m")
+        print(f"\x1b[34mConnecting to {label} '{target}'...\x1b[0m", flush=True)
 
+        self._invalidate_status_cache()
         self._run_command(["connect", target], timeout=120)
         self._wait_for_status(connected=True)
 
     def disconnect(self):
         """Disconnects from the VPN."""
-        print("\n\x1b[34mDisconnecting from NordVPN...\x1b[0m")
+        print("\n\x1b[34mDisconnecting from NordVPN...\x1b[0m", flush=True)
+        self._invalidate_status_cache()
         self._run_command(["disconnect"], timeout=90)
         self._wait_for_status(connected=False)
 
@@ -249,30 +597,70 @@ class LinuxVpnController:
         ]
 
         errors = []
-        for command in attempts:
-            if shutil.which(command[0]) is None:
-                errors.append(f"{command[0]} not found")
+        for name, *args in attempts:
+            executable = _which_cached(name)
+            if executable is None:
+                errors.append(f"{name} not found")
                 continue
 
+            command = [executable, *args]
             try:
-                subprocess.run(
+                # Output only matters when explaining a failure, so the first attempt
+                # discards it.
+                result = subprocess.run(
                     command,
-                    capture_output=True,
-                    text=True,
-                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
                     timeout=20,
                 )
-                return
-            except subprocess.CalledProcessError as e:
-                errors.append((e.stderr or e.stdout or str(e)).strip())
+                if result.returncode == 0:
+                    return
+
+                # Flushing is idempotent, so re-run with capture to get the error message.
+                result = _run_bounded(command, timeout=20)
+                if result.returncode == 0:
+                    return
+                error_output = (result.stderr or result.stdout).strip()
+                errors.append(
+                    error_output.decode("utf-8", errors="replace")
+                    or f"{name} exited with status {result.returncode}"
+                )
             except subprocess.TimeoutExpired:
-                errors.append(f"{' '.join(command)} timed out")
+                errors.append(f"{' '.join([name, *args])} timed out")
             except Exception as e:
                 errors.append(str(e))
 
         details = "; ".join(err for err in errors if err)
         raise NordVpnCliError(f"DNS flush failed: {details or 'no supported DNS flush command available'}")
 
+    @staticmethod
+    def _wait_for_pidfds(pidfds: Dict[int, str], timeout: float) -> Dict[int, str]:
+        """
+        Waits until the processes behind the given pidfds exit.
+
+        Args:
+            pidfds: Mapping of pidfd -> process name.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The subset of `pidfds` whose processes are still alive.
+        """
+        alive = dict(pidfds)
+        poller = select.poll()
+        for pidfd in alive:
+            poller.register(pidfd, select.POLLIN)
+
+        deadline = time.monotonic() + timeout
+        while alive:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for pidfd, _ in poller.poll(int(remaining * 1000)):
+                poller.unregister(pidfd)
+                alive.pop(pidfd, None)
+        return alive
+
     def close(self, force: bool = False):
         """
         Closes NordVPN processes on Linux.
@@ -280,27 +668,80 @@ class LinuxVpnController:
         Args:
             force: If True, kills processes immediately; otherwise terminates gracefully.
         """
-        print("\x1b[34mClosing NordVPN processes...\x1b[0m")
-        found = False
-        target_names = {"nordvpn", "nordvpnd"}
+        self._stop_status_polling()
+        print("\x1b[34mClosing NordVPN processes...\x1b[0m", flush=True)
 
-        for proc in psutil.process_iter(["name"]):
-            name = (proc.info.get("name") or "").lower()
-            if name in target_names:
-                found = True
+        targets = list(_find_processes_by_name({"nordvpn", "nordvpnd"}))
+        if not targets:
+            print("\x1b[33mNo NordVPN process was running.\x1b[0m")
+            return
+
+        # Signal every process first, then wait for all of them together so the
+        # total wait is bounded by the slowest process rather than their sum.
+        # Signals go through pidfds so a recycled PID can never be hit.
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        pidfds: Dict[int, str] = {}
+        fallback: Dict[psutil.Process, str] = {}
+        for pid, name in targets:
+            try:
+                pidfd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue
+            except (AttributeError, OSError):
+                # No pidfd support; fall back to psutil for this process.
                 try:
-                    if force:
-                        proc.kill()
-                    else:
-                        proc.terminate()
-                    proc.wait(timeout=5)
-                    print(f"\x1b[32m{name} closed.\x1b[0m")
-                except psutil.TimeoutExpired:
-                    if not force:
-                        print(f"\x1b[33m{name} did not exit in time, forcing close.\x1b[0m")
-                        proc.kill()
+                    proc = psutil.Process(pid)
+                    proc.send_signal(sig)
+                    fallback[proc] = name
+                except psutil.NoSuchProcess:
+                    pass
                 except Exception as e:
                     print(f"\x1b[91mFailed to close {name}: {e}\x1b[0m")
+                continue
 
-        if not found:
-            print("\x1b[33mNo NordVPN process was running.\x1b[0m")
+            try:
+                signal.pidfd_send_signal(pidfd, sig)
+            except ProcessLookupError:
+                os.close(pidfd)
+                continue
+            except OSError as e:
+                os.close(pidfd)
+                print(f"\x1b[91mFailed to close {name}: {e}\x1b[0m")
+                continue
+            pidfds[pidfd] = name
+
+        try:
+            alive = self._wait_for_pidfds(pidfds, timeout=5)
+            gone_fallback, alive_fallback = psutil.wait_procs(list(fallback), timeout=5)
+
+            for pidfd, name in pidfds.items():
+                if pidfd not in alive:
+                    print(f"\x1b[32m{name} closed.\x1b[0m")
+            for proc in gone_fallback:
+                print(f"\x1b[32m{fallback[proc]} closed.\x1b[0m")
+
+            for name in [*alive.values(), *(fallback[proc] for proc in alive_fallback)]:
+                if force:
+                    print(f"\x1b[91mFailed to close {name}: process did not exit in time.\x1b[0m")
+                else:
+                    print(f"\x1b[33m{name} did not exit in time, forcing close.\x1b[0m")
+            if force:
+                return
+
+            for pidfd, name in alive.items():
+                try:
+                    signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                except OSError as e:
+                    print(f"\x1b[91mFailed to close {name}: {e}\x1b[0m")
+            for proc in alive_fallback:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except Exception as e:
+                    print(f"\x1b[91mFailed to close {fallback[proc]}: {e}\x1b[0m")
+        finally:
+            for pidfd in pidfds:
+                os.close(pidfd)
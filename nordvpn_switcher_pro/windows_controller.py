@@ -1,22 +1,118 @@
+import ctypes
+import functools
 import os
 import ipaddress
+import re
 import subprocess
+import threading
 import time
 import psutil
+from collections import deque, namedtuple
 from typing import Any, Dict, List
 
 import requests
 
 from .exceptions import ConfigurationError, NordVpnCliError
 
-_CLI_IS_READY = False  # Tracks if the NordVPN CLI is ready for commands.
+# Placeholder values reported instead of an IP address (compared lower-cased).
+_JUNK_IP_VALUES = frozenset({"n/a", "none", "-"})
+_MAX_JUNK_IP_LEN = max(len(v) for v in _JUNK_IP_VALUES)
+# Dotted-quad IPv4 without leading zeros; octet range is checked separately.
+_IPV4_RE = re.compile(r"(?:0|[1-9][0-9]{0,2})(?:\.(?:0|[1-9][0-9]{0,2})){3}")
 
+# Server fields needed to report the connected server from a station IP match.
+_ServerInfo = namedtuple("_ServerInfo", "hostname name")
 
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_ip(value: str | None) -> str | None:
+    """
+    Normalizes an IP string to canonical format.
+
+    Results are memoized, so rebuilding the server lookup or repeating status
+    queries does not re-parse the same strings. Plain dotted-quad IPv4, the
+    form NordVPN reports for server stations, skips `ipaddress` parsing.
+
+    Returns:
+        Canonical IP string or None if parsing fails.
+    """
+    if not value:
+        return None
+
+    candidate = value.strip()
+    # Placeholders are at most 4 characters, so real addresses are never lower-cased.
+    if not candidate or (len(candidate) <= _MAX_JUNK_IP_LEN and candidate.lower() in _JUNK_IP_VALUES):
+        return None
+
+    if _IPV4_RE.fullmatch(candidate) and all(int(part) <= 255 for part in candidate.split(".")):
+        # Already canonical IPv4 (no leading zeros, octets in range).
+        return candidate
+
+    if candidate.startswith("[") and "]" in candidate:
+        candidate = candidate[1:candidate.index("]")]
+
+    if "%" in candidate:
+        candidate = candidate.split("%", 1)[0]
+
+    if "/" in candidate:
+        candidate = candidate.split("/", 1)[0]
+
+    try:
+        return str(ipaddress.ip_address(candidate))
+    except ValueError:
+        pass
+
+    first_colon = candidate.find(":")
+    if first_colon != -1 and first_colon == candidate.rfind(":") and "." in candidate:
+        host_part = candidate[:first_colon]
+        try:
+            return str(ipaddress.ip_address(host_part))
+        except ValueError:
+            return None
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dns_flush_function():
+    """
+    Loads `DnsFlushResolverCache` from dnsapi.dll.
+
+    This flushes the resolver cache in-process, without starting
+    `ipconfig.exe`. Loaded lazily because this module is also imported on
+    non-Windows platforms.
+
+    Returns:
+        The ctypes function (returns nonzero on success), or None if unavailable.
+    """
+    try:
+        flush = ctypes.WinDLL("dnsapi.dll").DnsFlushResolverCache
+    except (AttributeError, OSError):
+        return None
+    flush.argtypes = []
+    flush.restype = ctypes.c_int
+    return flush
+
+
+@functools.lru_cache(maxsize=1)
+def _candidate_exe_paths() -> tuple[str, ...]:
+    """Standard NordVPN.exe install locations, built once from the environment."""
+    return tuple(
+        os.path.join(os.environ.get(var, default), "NordVPN", "NordVPN.exe")
+        for var, default in (
+            ("ProgramFiles", r"C:\Program Files"),
+            ("ProgramFiles(x86)", r"C:\Program Files (x86)"),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def find_nordvpn_executable() -> str:
     """
     Finds the path to the NordVPN executable on Windows.
 
-    Checks a list of common installation directories.
+    Checks a list of common installation directories. A successful result is
+    memoized; failures are not, so a later call retries after installation.
 
     Returns:
         The full path to NordVPN.exe.
@@ -24,12 +120,7 @@ def find_nordvpn_executable() -> str:
     Raises:
         ConfigurationError: If the executable cannot be found.
     """
-    potential_paths = [
-        os.path.join(os.environ["ProgramFiles"], "NordVPN", "NordVPN.exe"),
-        os.path.join(os.environ["ProgramFiles(x86)"], "NordVPN", "NordVPN.exe"),
-    ]
-
-    for path in potential_paths:
+    for path in _candidate_exe_paths():
         if os.path.exists(path):
             return path
 
@@ -43,6 +134,10 @@ class WindowsVpnController:
     """
     Controls the NordVPN Windows client via its command-line interface.
     """
+
+    IP_CACHE_TTL = 2.0  # Seconds a resolved public IP may be reused.
+    DISCONNECTED_STATUS_TTL = 1.0  # Seconds after disconnect() during which status is known without a lookup.
+
     def __init__(self, exe_path: str):
         """
         Initializes the controller with the path to NordVPN.exe.
@@ -54,158 +149,233 @@ class WindowsVpnController:
             raise ConfigurationError(f"Executable not found at path: {exe_path}")
         self.exe_path = exe_path
         self.cwd_path = os.path.dirname(exe_path)
-        self._server_ip_lookup: Dict[str, Dict[str, Any]] = {}
-
-    def _wait_for_cli_ready(self, threshold_mb: int = 200, stability_window: int = 6, variance_pct: float = 1.0, timeout: int = 60):
+        self._server_ip_lookup: Dict[str, _ServerInfo] = {}
+        self._nordvpn_proc: psutil.Process | None = None
+        self._cli_ready: bool = False  # Tracks if the NordVPN CLI is ready for commands.
+        self._cli_ready_lock = threading.Lock()
+        self._session = requests.Session()  # Keep-alive connection for public IP lookups.
+        self._ip_cache: tuple[float, str | None] | None = None
+        self._last_action: str | None = None
+        self._last_action_ts: float = 0.0
+
+    def _wait_for_cli_ready(self, threshold_mb: int = 200, stability_window: int = 6, variance_pct: float = 1.0, timeout: int = 60,
+                            min_interval: float = 0.1, max_interval: float = 0.5):
         """
         Waits until the NordVPN GUI has fully started and stabilized.
         Stability is determined by both a memory threshold and minimal variance.
         Args:
             threshold_mb: Minimum memory usage in MB to consider the app started.
-            stability_window: Number of consecutive samples to check for stability (check every 0.5s -> window of 6, means 3 seconds).
+            stability_window: Number of consecutive samples to check for stability. Sampling starts every
+                `min_interval` seconds and backs off towards `max_interval`, so the window covers a variable
+                span of time (a window of 6 at the 0.5s cap means 3 seconds).
             variance_pct: Maximum allowed percentage variance in memory usage.
             timeout: Maximum time to wait in seconds.
+            min_interval: Initial delay between memory samples in seconds.
+            max_interval: Upper bound for the delay between memory samples in seconds.
         """
-        global _CLI_IS_READY
-        if _CLI_IS_READY:
+        if self._cli_ready:
             return
 
+        with self._cli_ready_lock:
+            if self._cli_ready:
+                return
+            self._launch_and_wait_until_stable(
+                threshold_mb, stability_window, variance_pct, timeout, min_interval, max_interval
+            )
+            self._cli_ready = True
+
+    def _launch_and_wait_until_stable(self, threshold_mb: int, stability_window: int, variance_pct: float, timeout: int,
+                                      min_interval: float, max_interval: float):
+        """
+        Launches the NordVPN GUI and blocks until its memory usage is stable.
+
+        See `_wait_for_cli_ready` for the meaning of the arguments.
+
+        Raises:
+            NordVpnCliError: If the app does not stabilize within `timeout` seconds.
+        """
         print("\n\x1b[33mNordVPN launch command issued.\x1b[0m")
 
         # Launch GUI via Popen so it doesn’t block.
+        launched_pid = None
         try:
-            subprocess.Popen(
+            launched_pid = subprocess.Popen(
                 [self.exe_path],
-                shell=True,
                 cwd=self.cwd_path,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+            ).pid
         except Exception as e:
             print(f"\x1b[31mLaunch failed: {e}\x1b[0m")
 
         # steady-state detector
         print("\x1b[33mWaiting for NordVPN to become stable...\x1b[0m")
         start_time = time.time()
-        samples = []
+        # Samples stay in integer bytes. The variance test below is the float
+        # check (max_dev / avg * 100 <= variance_pct) multiplied through by the
+        # window size, so it needs no division.
+        threshold_bytes = int(threshold_mb * 1024 * 1024)
+        samples = deque(maxlen=stability_window)
+        running_sum = 0
+        # Sample quickly at first so an already-running app is detected early,
+        # then back off to the old 0.5s cadence while the app is still loading.
+        interval = min_interval
 
         while time.time() - start_time < timeout:
-            for proc in psutil.process_iter(["name", "memory_info"]):
-                if proc.info["name"] == "NordVPN.exe":
-                    mem_mb = proc.info["memory_info"].rss / (1024 * 1024)
-                    samples.append(mem_mb)
-                    if len(samples) > stability_window:
-                        samples.pop(0)
-
-                    if mem_mb > threshold_mb and len(samples) == stability_window:
-                        avg = sum(samples) / stability_window
-                        max_dev = max(abs(s - avg) for s in samples)
-                        if (max_dev / avg) * 100 <= variance_pct:
-                            print("\x1b[32mNordVPN CLI is ready.\x1b[0m\n")
-                            _CLI_IS_READY = True
-                            return
-            time.sleep(0.5)
+            rss = self._sample_nordvpn_rss(launched_pid)
+            if rss is not None:
+                if len(samples) == stability_window:
+                    running_sum -= samples[0]
+                samples.append(rss)
+                running_sum += rss
+
+                if rss > threshold_bytes and len(samples) == stability_window:
+                    # Largest distance from the mean is at one of the extremes
+                    # (scaled by the window size).
+                    max_dev_scaled = max(
+                        stability_window * max(samples) - running_sum,
+                        running_sum - stability_window * min(samples),
+                    )
+                    if max_dev_scaled * 100 <= variance_pct * running_sum:
+                        print("\x1b[32mNordVPN CLI is ready.\x1b[0m\n")
+                        return
+            time.sleep(interval)
+            interval = min(interval * 1.3, max_interval)
 
         raise NordVpnCliError(
             f"NordVPN did not reach steady state within {timeout} seconds. "
             "Please ensure the application is running and logged in."
         )
 
-    def _run_command(self, args: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+    def _sample_nordvpn_rss(self, launched_pid: int | None = None) -> int | None:
         """
-        Executes a NordVPN CLI command after ensuring readiness.
-        Uses Popen with controlled waiting to avoid DNS/routing issues
-        caused by overlapping service reconfiguration.
+        Reads the current memory usage of the NordVPN GUI process.
+
+        Locates the process on first use and keeps it cached. Name and memory
+        are read in one `oneshot()` snapshot, so a recycled PID that now belongs
+        to another program is detected instead of being sampled.
 
         Args:
-            args: List of CLI arguments (e.g. ["-c", "-n", "Germany #741"])
-            timeout: Max time (seconds) to wait for command stabilization.
+            launched_pid: PID of the process we launched, used as a lookup hint.
+
         Returns:
-            subprocess.CompletedProcess-like object with stdout/stderr.
-        Raises:
-            ConfigurationError, NordVpnCliError
+            Resident memory in bytes, or None if NordVPN.exe is not (or no longer) running.
         """
-        self._wait_for_cli_ready()
-
-        # Quote each argument that contains spaces or special characters
-        quoted_args = [
-            f'"{a}"' if (" " in a or "#" in a or "&" in a) else a
-            for a in args
-        ]
-        command = f'"{self.exe_path}" {" ".join(quoted_args)}'
-        # print(f"\n\x1b[34mRunning NordVPN CLI command: {command}\x1b[0m")
+        if self._nordvpn_proc is None:
+            self._nordvpn_proc = self._locate_nordvpn_process(launched_pid)
+            if self._nordvpn_proc is None:
+                return None
 
         try:
-            process = subprocess.Popen(
-                command,
-                shell=True,                    # run in shell context (ensures env consistency)
-                cwd=self.cwd_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+            with self._nordvpn_proc.oneshot():
+                name = self._nordvpn_proc.name()
+                rss = self._nordvpn_proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            name = None
+
+        if name != "NordVPN.exe":
+            # The GUI exited or respawned; locate it again on the next tick.
+            self._nordvpn_proc = None
+            return None
+        return rss
 
-            try:
-                stdout, stderr = process.communicate(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                process.terminate()
-                raise NordVpnCliError(f"NordVPN CLI command timed out after {timeout} seconds.")
-
-            if process.returncode != 0:
-                error_message = stderr.strip() or stdout.strip()
-                raise NordVpnCliError(
-                    f"NordVPN CLI command '{command}' failed.\nError: {error_message}"
-                )
+    @staticmethod
+    def _locate_nordvpn_process(pid: int | None = None) -> psutil.Process | None:
+        """
+        Finds the running NordVPN GUI process.
 
-            # Return consistent result object
-            return subprocess.CompletedProcess(
-                args=command, returncode=process.returncode, stdout=stdout, stderr=stderr
-            )
+        The launched PID is checked first. It is only a hint: if the app was
+        already running, it belongs to a second instance that hands off to the
+        running app and exits. If it is not NordVPN.exe, all processes are
+        scanned once.
 
-        except FileNotFoundError:
-            raise ConfigurationError(f"Executable not found at path: {self.exe_path}")
-        except Exception as e:
-            raise NordVpnCliError(f"Unexpected error while running '{command}': {e}")
+        Args:
+            pid: PID of the process we launched, if any.
+
+        Returns:
+            The NordVPN.exe process, or None if it is not running.
+        """
+        if pid is not None:
+            try:
+                proc = psutil.Process(pid)
+                if proc.name() == "NordVPN.exe":
+                    return proc
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        procs = WindowsVpnController._find_nordvpn_processes()
+        return procs[0] if procs else None
 
     @staticmethod
-    def _normalize_ip(value: str | None) -> str | None:
+    def _find_nordvpn_processes() -> List[psutil.Process]:
         """
-        Normalizes an IP string to canonical format.
+        Scans all processes for running NordVPN.exe instances.
+
+        Iterates raw PIDs and reads only each process name, skipping the
+        per-process bookkeeping that `psutil.process_iter` performs.
 
         Returns:
-            Canonical IP string or None if parsing fails.
+            A list of matching processes (possibly empty).
         """
-        if not value:
-            return None
-
-        candidate = value.strip()
-        if not candidate or candidate.lower() in {"n/a", "none", "-"}:
-            return None
+        procs = []
+        for pid in psutil.pids():
+            try:
+                proc = psutil.Process(pid)
+                if proc.name() == "NordVPN.exe":
+                    procs.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return procs
 
-        if candidate.startswith("[") and "]" in candidate:
-            candidate = candidate[1:candidate.index("]")]
+    def _run_command(self, args: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+        """
+        Executes a NordVPN CLI command after ensuring readiness.
+        Waits for the command to finish (or time out) so service
+        reconfiguration does not overlap with the next command.
 
-        if "%" in candidate:
-            candidate = candidate.split("%", 1)[0]
+        Args:
+            args: List of CLI arguments (e.g. ["-c", "-n", "Germany #741"])
+            timeout: Max time (seconds) to wait for command stabilization.
+        Returns:
+            subprocess.CompletedProcess with stdout/stderr.
+        Raises:
+            ConfigurationError, NordVpnCliError
+        """
+        self._wait_for_cli_ready()
 
-        if "/" in candidate:
-            candidate = candidate.split("/", 1)[0]
+        # Pass an argv list directly: no intermediate cmd.exe process, and
+        # arguments containing spaces, '#' or '&' need no manual quoting.
+        command = [self.exe_path, *args]
+        # Same quoting subprocess applies on Windows, so messages show the real command line.
+        display_command = subprocess.list2cmdline(command)
 
         try:
-            return str(ipaddress.ip_address(candidate))
-        except ValueError:
-            pass
+            result = subprocess.run(
+                command,
+                cwd=self.cwd_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+        except FileNotFoundError as e:
+            raise ConfigurationError(f"Executable not found at path: {self.exe_path}") from e
+        except subprocess.TimeoutExpired as e:
+            raise NordVpnCliError(
+                f"NordVPN CLI command '{display_command}' timed out after {timeout} seconds."
+            ) from e
+        except Exception as e:
+            raise NordVpnCliError(f"Unexpected error while running '{display_command}': {e}") from e
 
-        if candidate.count(":") == 1 and "." in candidate:
-            host_part = candidate.rsplit(":", 1)[0]
-            try:
-                return str(ipaddress.ip_address(host_part))
-            except ValueError:
-                return None
+        if result.returncode != 0:
+            error_message = (result.stderr or result.stdout or "").strip()
+            raise NordVpnCliError(
+                f"NordVPN CLI command '{display_command}' failed.\nError: {error_message}"
+            )
 
-        return None
+        return result
 
     def set_server_ip_lookup(self, servers: List[Dict[str, Any]]):
         """
@@ -214,54 +384,71 @@ class WindowsVpnController:
         Args:
             servers: List of server dictionaries containing at least `station`.
         """
-        lookup: Dict[str, Dict[str, Any]] = {}
-        for server in servers:
-            normalized_station = self._normalize_ip(server.get("station"))
-            if not normalized_station:
-                continue
-            lookup[normalized_station] = {
-                "id": server.get("id"),
-                "name": server.get("name"),
-                "hostname": server.get("hostname"),
-                "station": server.get("station"),
-                "status": server.get("status"),
-            }
-        self._server_ip_lookup = lookup
+        self._server_ip_lookup = {
+            station: _ServerInfo(server.get("hostname"), server.get("name"))
+            for server in servers
+            if (station := _normalize_ip(server.get("station")))
+        }
 
     def has_server_ip_lookup(self) -> bool:
         """Returns True when server station IP lookup has been initialized."""
         return bool(self._server_ip_lookup)
 
+    def invalidate_ip_cache(self):
+        """Discards the cached public IP so the next status query resolves it again."""
+        self._ip_cache = None
+
     def _get_public_ip(self) -> str | None:
         """
         Resolves the current public IP via NordVPN API insights endpoint.
 
+        Results are reused for `IP_CACHE_TTL` seconds so back-to-back status
+        queries share one request.
+
         Returns:
             Current public IP string or None if not available.
 
         Raises:
             NordVpnCliError: If the lookup request fails.
         """
+        cached = self._ip_cache
+        if cached and time.monotonic() - cached[0] < self.IP_CACHE_TTL:
+            return cached[1]
+
         url = "https://api.nordvpn.com/v1/helpers/ips/insights"
         try:
-            response = requests.get(url, timeout=20)
+            response = self._session.get(url, timeout=20)
             response.raise_for_status()
             payload = response.json() or {}
         except requests.RequestException as e:
             raise NordVpnCliError(f"Failed to resolve public IP for status lookup: {e}") from e
 
         value = payload.get("ip")
-        return value.strip() if isinstance(value, str) and value.strip() else None
+        ip = value.strip() if isinstance(value, str) and value.strip() else None
+        self._ip_cache = (time.monotonic(), ip)
+        return ip
 
     def _resolve_status_snapshot(self) -> Dict[str, str]:
         """
         Resolves Windows VPN status using current public IP and server IP lookup.
 
+        Skips the public IP request when the answer is already known: right
+        after `disconnect()`, or when no server lookup is available to match
+        against.
+
         Returns:
             Dictionary with status, IP, and server fields when available.
         """
+        if (
+            self._last_action == "disconnected"
+            and time.monotonic() - self._last_action_ts < self.DISCONNECTED_STATUS_TTL
+        ):
+            return {"status": "Disconnected"}
+        if not self._server_ip_lookup:
+            return {"status": "Unknown"}
+
         current_ip = self._get_public_ip()
-        normalized_ip = self._normalize_ip(current_ip)
+        normalized_ip = _normalize_ip(current_ip)
         server = self._server_ip_lookup.get(normalized_ip) if normalized_ip else None
 
         snapshot: Dict[str, str] = {
@@ -270,8 +457,7 @@ class WindowsVpnController:
         if current_ip:
             snapshot["current ip"] = current_ip
         if server:
-            hostname = server.get("hostname")
-            name = server.get("name")
+            hostname, name = server.hostname, server.name
             snapshot["current server"] = hostname or name
             if name:
                 snapshot["server name"] = str(name)
@@ -325,21 +511,56 @@ class WindowsVpnController:
             is_group: If True, uses the '-g' flag for group connection.
         """
         args = ["-c", "-g", f"{target}"] if is_group else ["-c", "-n", f"{target}"]
-        print(f"\x1b[34mConnecting to '{target}'...\x1b[0m")
-        self._run_command(args)
+        print(f"\x1b[34mConnecting to '{target}'...\x1b[0m", flush=True)
+        self._last_action = None
+        try:
+            self._run_command(args)
+        finally:
+            self.invalidate_ip_cache()
 
     def disconnect(self):
         """Disconnects from the VPN."""
-        print("\n\x1b[34mDisconnecting from NordVPN...\x1b[0m")
-        self._run_command(["-d"])
+        print("\n\x1b[34mDisconnecting from NordVPN...\x1b[0m", flush=True)
+        try:
+            self._run_command(["-d"])
+        finally:
+            self.invalidate_ip_cache()
+        self._last_action = "disconnected"
+        self._last_action_ts = time.monotonic()
 
-    def flush_dns_cache(self):
+    def flush_dns_cache(self, wait: bool = True):
         """
-        Flushes the Windows DNS resolver cache using `ipconfig /flushdns`.
+        Flushes the Windows DNS resolver cache.
+
+        Calls `DnsFlushResolverCache` from dnsapi.dll directly, falling back to
+        `ipconfig /flushdns` if the DLL call is unavailable or fails.
+
+        Args:
+            wait: Only affects the `ipconfig` fallback. If True, blocks until
+                the flush has completed. If False, starts `ipconfig` in the
+                background and returns immediately; use this when nothing
+                depends on the flush having finished.
 
         Raises:
-            NordVpnCliError: If the flush command fails.
+            NordVpnCliError: If the flush command fails (or, with wait=False,
+                cannot be started).
         """
+        flush = _load_dns_flush_function()
+        if flush is not None and flush():
+            return
+
+        if not wait:
+            try:
+                subprocess.Popen(
+                    ["ipconfig", "/flushdns"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                )
+            except Exception as e:
+                raise NordVpnCliError(f"Unexpected error while flushing DNS: {e}") from e
+            return
+
         try:
             subprocess.run(
                 ["ipconfig", "/flushdns"],
@@ -360,28 +581,50 @@ class WindowsVpnController:
         Args:
             force: If True, kills the process immediately instead of attempting graceful termination.
         """
-        global _CLI_IS_READY
-        print("\x1b[34mClosing NordVPN.exe...\x1b[0m")
-        found = False
+        print("\x1b[34mClosing NordVPN.exe...\x1b[0m", flush=True)
+
+        # Prefer the process found while waiting for readiness; only scan when it is gone.
+        cached = self._nordvpn_proc
+        self._nordvpn_proc = None
+        if cached is not None and cached.is_running():
+            procs = [cached]
+        else:
+            procs = self._find_nordvpn_processes()
 
-        for proc in psutil.process_iter(["name"]):
-            if proc.info["name"] == "NordVPN.exe":
-                found = True
+        if not procs:
+            print("\x1b[33mNordVPN.exe was not running.\x1b[0m")
+            return
+
+        signalled = []
+        for proc in procs:
+            try:
+                if force:
+                    proc.kill()
+                else:
+                    proc.terminate()
+                signalled.append(proc)
+            except psutil.NoSuchProcess:
+                pass
+            except Exception as e:
+                print(f"\x1b[91mFailed to close NordVPN.exe: {e}\x1b[0m")
+
+        def report_closed(_proc: psutil.Process):
+            print("\x1b[32mNordVPN.exe closed.\x1b[0m")
+
+        # Wait for all signalled processes at once instead of one after another.
+        _, alive = psutil.wait_procs(signalled, timeout=5, callback=report_closed)
+        if alive and not force:
+            print("\x1b[33mProcess did not exit in time, forcing close.\x1b[0m")
+            for proc in alive:
                 try:
-                    if force:
-                        proc.kill()
-                    else:
-                        proc.terminate()
-                    proc.wait(timeout=5)
-                    print("\x1b[32mNordVPN.exe closed.\x1b[0m")
-                except psutil.TimeoutExpired:
-                    if not force:
-                        print("\x1b[33mProcess did not exit in time, forcing close.\x1b[0m")
-                        proc.kill()
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
                 except Exception as e:
                     print(f"\x1b[91mFailed to close NordVPN.exe: {e}\x1b[0m")
-                _CLI_IS_READY = False
+            _, alive = psutil.wait_procs(alive, timeout=5, callback=report_closed)
 
-        if not found:
-            print("\x1b[33mNordVPN.exe was not running.\x1b[0m")
+        for _ in alive:
+            print("\x1b[91mFailed to close NordVPN.exe: process did not exit in time.\x1b[0m")
 
+        self._cli_ready = False